@@ -1,24 +1,46 @@
 from collections.abc import AsyncGenerator
 
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.session import async_session
+from src.services.cache import CacheService
 from src.services.minio import MinioService
 
 
-async def get_minio_service() -> AsyncGenerator[MinioService]:
+def get_minio_service(request: Request) -> MinioService:
     """
-    Provide a MinioService instance within the context.
+    Provide the application-wide MinioService instance.
 
-    Use this dependency to obtain an instance of MinioService for handling MinIO operations.
-    The instance is created and managed within an asynchronous context, ensuring proper resource cleanup.
+    The service and its S3 client are created once in the application lifespan and shared by all requests,
+    so connections to MinIO are pooled instead of being set up for every request.
 
-    Yields:
-        MinioService: An instance of MinioService to interact with MinIO storage.
+    Args:
+        request (Request): The incoming request, used to access the application state.
+
+    Returns:
+        MinioService: The shared instance of MinioService to interact with MinIO storage.
+
+    """
+    minio_service: MinioService = request.app.state.minio_service
+    return minio_service
+
+
+def get_cache_service(request: Request) -> CacheService:
+    """
+    Provide the application-wide CacheService instance.
+
+    The service and its Redis connection pool are created once in the application lifespan and shared by all requests.
+
+    Args:
+        request (Request): The incoming request, used to access the application state.
+
+    Returns:
+        CacheService: The shared instance of CacheService to interact with the Redis cache.
 
     """
-    async with MinioService() as service:
-        yield service
+    cache_service: CacheService = request.app.state.cache_service
+    return cache_service
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession]:
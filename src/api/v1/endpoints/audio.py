@@ -1,40 +1,252 @@
-import io
+import asyncio
 import logging
 import uuid
-from typing import Annotated
+from contextlib import AbstractContextManager
+from typing import Annotated, Protocol, cast
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
-from sqlalchemy import select
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Response, UploadFile
+from kombu import Producer
+from sqlalchemy import delete, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from uuid_utils.compat import uuid7
 
-from src.api.dependencies import get_db_session, get_minio_service
+from src.api.dependencies import get_cache_service, get_db_session, get_minio_service
+from src.celery.celery import celery_app
+from src.core.config import settings
 from src.core.enums.audio import TaskStatusEnum
 from src.db.models.audio import AudioProcessingTask
+from src.db.session import async_session
 from src.schemas.audio import AudioProcessResponseSchema, AudioTaskResultResponseSchema
+from src.services.cache import CacheService
 from src.services.minio import MinioService
-from src.tasks.audio import process_audio_file
 
 logger = logging.getLogger(__name__)
 audio_router = APIRouter(prefix="/audiofiles")
 
 
+class _ProducerPool(Protocol):
+    """The part of kombu's `ProducerPool` used here, which the type stubs do not declare."""
+
+    def acquire(self, block: bool = False) -> AbstractContextManager[Producer]: ...
+
+
+# Loads of task results currently in progress, shared by concurrent requests for the same task.
+_inflight_results: dict[uuid.UUID, asyncio.Future[bytes | None]] = {}
+
+AUDIO_HEADER_SIZE = 12
+AUDIO_SIGNATURES: tuple[bytes, ...] = (
+    b"ID3",  # MP3 with an ID3v2 tag
+    b"RIFF",  # WAV
+    b"OggS",  # Ogg Vorbis / Opus
+    b"fLaC",  # FLAC
+    b"FORM",  # AIFF
+    b"#!AMR",  # AMR
+    b"\x1aE\xdf\xa3",  # WebM / Matroska
+)
+
+
+def _has_audio_signature(header: bytes) -> bool:
+    """
+    Check whether the first bytes of a file match a known audio container signature.
+
+    Args:
+        header (bytes): The first `AUDIO_HEADER_SIZE` bytes of the file.
+
+    Returns:
+        bool: True if the header looks like an audio file, False otherwise.
+    """
+    if header.startswith(AUDIO_SIGNATURES):
+        return True
+    # MPEG audio frame sync (MP3 without ID3 tag, AAC ADTS).
+    if len(header) >= 2 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0:
+        return True
+    # ISO base media file (M4A / MP4 audio).
+    return header[4:8] == b"ftyp"
+
+
+async def _create_task(session: AsyncSession, task_id: uuid.UUID, file_key: str) -> None:
+    """
+    Create the task record in the database with a status of PENDING.
+
+    Args:
+        session (AsyncSession): The database session.
+        task_id (uuid.UUID): The pre-generated unique identifier of the task.
+        file_key (str): The key of the audio file in MinIO storage.
+    """
+    stmt = insert(AudioProcessingTask).values(id=task_id, status=TaskStatusEnum.PENDING, audio_file_key=file_key)
+    async with session.begin():
+        await session.execute(stmt)
+
+
+def _publish_task(task_id: uuid.UUID, file_key: str) -> None:
+    """
+    Send the Celery task for processing the audio file.
+
+    Args:
+        task_id (uuid.UUID): The unique identifier of the task.
+        file_key (str): The key of the uploaded audio file in MinIO storage.
+
+    Raises:
+        Exception: If the task could not be sent to the broker.
+    """
+    producer_pool = cast(_ProducerPool, celery_app.producer_pool)
+    with producer_pool.acquire(block=True) as producer:
+        # Sent by name so the API does not import the task module and, with it, the GenAI client.
+        celery_app.send_task(
+            "process_audio_file",
+            args=(str(task_id), file_key),
+            queue="audio_processing",
+            producer=producer,
+        )
+
+
+async def _enqueue_task(task_id: uuid.UUID, file_key: str) -> None:
+    """
+    Send the Celery task for processing the audio file, marking the task as FAILURE if it cannot be sent.
+
+    Runs as a background task after the `202 Accepted` response has been sent,
+    so the broker publish does not add to the client's response time. The blocking publish runs in a thread.
+
+    Args:
+        task_id (uuid.UUID): The unique identifier of the task.
+        file_key (str): The key of the uploaded audio file in MinIO storage.
+    """
+    try:
+        await asyncio.to_thread(_publish_task, task_id, file_key)
+    except Exception as e:
+        logger.error("API: Failed to send task %s to Celery: %s", task_id, e, exc_info=True)
+        stmt = (
+            update(AudioProcessingTask)
+            .where(AudioProcessingTask.id == task_id)
+            .values(status=TaskStatusEnum.FAILURE, error_message=f"Failed to queue the task for processing: {e}")
+        )
+        try:
+            async with async_session() as session, session.begin():
+                await session.execute(stmt)
+        except Exception as db_e:
+            logger.error("API: Failed to mark task %s as FAILURE: %s", task_id, db_e, exc_info=True)
+        return
+
+    logger.info("API: Task %s sent to Celery.", task_id)
+
+
+async def _load_task_result(session: AsyncSession, cache_service: CacheService, task_id: uuid.UUID) -> bytes | None:
+    """
+    Load the serialized result of a task from the cache, or from the database on a cache miss.
+
+    Results loaded from the database are cached: briefly while the task is still running, and longer
+    once it has finished, since a finished task no longer changes. The STARTED status is not written to
+    the database, so for a PENDING task the status published by the worker is used, if any.
+
+    Args:
+        session (AsyncSession): The database session.
+        cache_service (CacheService): The cache service.
+        task_id (uuid.UUID): The unique identifier of the task.
+
+    Returns:
+        bytes | None: The JSON body of `AudioTaskResultResponseSchema`, or None if the task does not exist.
+    """
+    cached = await cache_service.get_task_result(task_id)
+    if cached is not None:
+        return cached
+
+    task = await session.get(AudioProcessingTask, task_id)
+
+    if not task:
+        return None
+
+    status = task.status
+    if status == TaskStatusEnum.PENDING:
+        published_status = await cache_service.get_task_status(task_id)
+        if published_status is not None:
+            status = TaskStatusEnum(published_status)
+
+    response = AudioTaskResultResponseSchema(
+        task_id=task.id,
+        status=status,
+        created_at=task.created_at,
+        updated_at=task.updated_at,
+        result=task.ai_response if task.status == TaskStatusEnum.SUCCESS else None,
+        error_message=task.error_message if task.status == TaskStatusEnum.FAILURE else None,
+    )
+    body = response.model_dump_json().encode()
+
+    is_finished = task.status in (TaskStatusEnum.SUCCESS, TaskStatusEnum.FAILURE)
+    ttl = settings.TASK_RESULT_FINAL_CACHE_TTL if is_finished else settings.TASK_RESULT_CACHE_TTL
+    await cache_service.set_task_result(task_id, body, ttl)
+
+    return body
+
+
+async def _load_task_result_once(session: AsyncSession, cache_service: CacheService, task_id: uuid.UUID) -> bytes | None:
+    """
+    Load the serialized result of a task, sharing a single load between concurrent requests for the same task.
+
+    The first request for a task ID performs the load; requests arriving while it is in flight await its result
+    instead of querying the cache and the database themselves. If the first request is cancelled, the waiting
+    requests load the result themselves.
+
+    Args:
+        session (AsyncSession): The database session.
+        cache_service (CacheService): The cache service.
+        task_id (uuid.UUID): The unique identifier of the task.
+
+    Returns:
+        bytes | None: The JSON body of `AudioTaskResultResponseSchema`, or None if the task does not exist.
+    """
+    inflight = _inflight_results.get(task_id)
+    if inflight is not None:
+        try:
+            return await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            current_task = asyncio.current_task()
+            if not inflight.cancelled() or (current_task is not None and current_task.cancelling()):
+                raise
+            # The leading request was cancelled, e.g. because its client disconnected: load the result ourselves.
+            return await _load_task_result(session, cache_service, task_id)
+
+    future: asyncio.Future[bytes | None] = asyncio.get_running_loop().create_future()
+    _inflight_results[task_id] = future
+    try:
+        body = await _load_task_result(session, cache_service, task_id)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Mark the exception as retrieved in case no other request is waiting for it.
+        future.exception()
+        raise
+    else:
+        future.set_result(body)
+        return body
+    finally:
+        del _inflight_results[task_id]
+
+
 @audio_router.post("/process", status_code=202, response_model=AudioProcessResponseSchema)
 async def process_audio(
     audio_file: Annotated[UploadFile, File(description="Audiofile for processing")],
+    background_tasks: BackgroundTasks,
     session: Annotated[AsyncSession, Depends(get_db_session)],
     minio_service: Annotated[MinioService, Depends(get_minio_service)],
-) -> AudioProcessResponseSchema:
+) -> Response:
     """
-    Accept an audio file, store it in MinIO, create a task in the database,
-    and send a Celery task for processing. Return the task ID.
+    Accept an audio file, store it in MinIO, create a task in the database and return the task ID.
+
+    The upload and the database insert run concurrently. If one of them fails, the result of the other
+    is removed. The Celery task is sent in the background once the response is sent.
 
     Args:
-        audio_file (UploadFile): The audio file to be processed. Must have a content type starting with "audio/".
+        audio_file (UploadFile): The audio file to be processed. Must have a content type starting with "audio/"
+            and start with a known audio file signature.
+        background_tasks (BackgroundTasks): Tasks run after the response is sent.
         session (AsyncSession): The database session dependency.
         minio_service (MinioService): The MinIO service dependency for file uploads.
 
     Returns:
-        AudioProcessResponseSchema: A schema containing the task ID of the created processing task.
+        Response: A JSON response serialized from `AudioProcessResponseSchema`, containing the task ID
+                  of the created processing task.
 
     Raises:
         HTTPException: If the uploaded file is not a valid audio file (status code 400).
@@ -42,54 +254,69 @@ async def process_audio(
     if not audio_file.content_type or not audio_file.content_type.startswith("audio/"):
         raise HTTPException(status_code=400, detail="The file must be an audiofile")
 
+    header = await audio_file.read(AUDIO_HEADER_SIZE)
+    await audio_file.seek(0)
+    if not _has_audio_signature(header):
+        raise HTTPException(status_code=400, detail="The file must be an audiofile")
+
     file_extension = audio_file.filename.split(".")[-1] if audio_file.filename else "bin"
-    file_content = await audio_file.read()
+    task_id = uuid7()
+    file_key = f"{task_id}.{file_extension}"
 
-    file_stream = io.BytesIO(file_content)
-    file_key = await minio_service.upload_file(file_stream, file_extension)
+    # Hand the spooled upload over as-is so the body is streamed to MinIO instead of being copied into memory.
+    upload_result, create_result = await asyncio.gather(
+        minio_service.upload_file_with_key(audio_file.file, file_key),
+        _create_task(session, task_id, file_key),
+        return_exceptions=True,
+    )
 
-    new_task = AudioProcessingTask(status=TaskStatusEnum.PENDING, audio_file_key=file_key)
-    session.add(new_task)
-    await session.commit()
-    await session.refresh(new_task)
+    if isinstance(create_result, BaseException):
+        if not isinstance(upload_result, BaseException):
+            try:
+                await minio_service.delete_file(file_key)
+            except Exception as e:
+                logger.error("API: Failed to remove file %s after task creation failed: %s", file_key, e)
+        raise create_result
+    if isinstance(upload_result, BaseException):
+        try:
+            async with session.begin():
+                await session.execute(delete(AudioProcessingTask).where(AudioProcessingTask.id == task_id))
+        except Exception as e:
+            logger.error("API: Failed to remove task %s after upload failed: %s", task_id, e)
+        raise upload_result
 
-    process_audio_file.apply_async(args=(str(new_task.id), file_key), queue="audio_processing")
+    background_tasks.add_task(_enqueue_task, task_id, file_key)
 
-    logger.info(f"API: Task {new_task.id} sent to Celery.")
-    return AudioProcessResponseSchema(task_id=new_task.id)
+    response = AudioProcessResponseSchema(task_id=task_id)
+    return Response(content=response.model_dump_json(), status_code=202, media_type="application/json")
 
 
 @audio_router.get("/results/{task_id}", status_code=200, response_model=AudioTaskResultResponseSchema)
 async def get_task_result(
     task_id: uuid.UUID,
     session: Annotated[AsyncSession, Depends(get_db_session)],
-) -> AudioTaskResultResponseSchema:
+    cache_service: Annotated[CacheService, Depends(get_cache_service)],
+) -> Response:
     """
     Retrieve information about the status and result of an audio processing task by its ID.
 
+    Responses are cached in Redis, and concurrent requests for the same task share a single load.
+
     Args:
         task_id (UUID): The unique identifier of the audio processing task.
         session (AsyncSession): The database session dependency.
+        cache_service (CacheService): The cache service dependency.
 
     Returns:
-        AudioTaskResultResponseSchema: A schema containing the task ID, status, timestamps,
-                                       and optional result or error message.
+        Response: A JSON response serialized from `AudioTaskResultResponseSchema`, containing the task ID,
+                  status, timestamps, and optional result or error message.
 
     Raises:
         HTTPException: If the task with the specified ID is not found (status code 404).
     """
-    stmt = select(AudioProcessingTask).where(AudioProcessingTask.id == task_id)
-    result = await session.execute(stmt)
-    task = result.scalar_one_or_none()
+    body = await _load_task_result_once(session, cache_service, task_id)
 
-    if not task:
+    if body is None:
         raise HTTPException(status_code=404, detail="Task not found.")
 
-    return AudioTaskResultResponseSchema(
-        task_id=task.id,
-        status=task.status,
-        created_at=task.created_at,
-        updated_at=task.updated_at,
-        result=task.ai_response if task.status == TaskStatusEnum.SUCCESS else None,
-        error_message=task.error_message if task.status == TaskStatusEnum.FAILURE else None,
-    )
+    return Response(content=body, media_type="application/json")
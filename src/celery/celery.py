@@ -1,6 +1,36 @@
+from typing import Any
+
+import orjson
 from celery import Celery
+from kombu.serialization import register
+
 from src.celery.config import celery_settings
 
+
+def _orjson_dumps(obj: Any) -> str:
+    """
+    Serialize a message body or task result with orjson.
+
+    kombu expects encoders to return `str`, while `orjson.dumps` returns `bytes`. Non-string dict keys are
+    allowed, as in the stdlib json serializer, because failure results carry error details parsed from GenAI errors.
+
+    Args:
+        obj (Any): The message body to serialize.
+
+    Returns:
+        str: The JSON representation of the body.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+register(
+    "orjson",
+    _orjson_dumps,
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="utf-8",
+)
+
 celery_app = Celery(
     "audio_processor",
     broker=celery_settings.CELERY_BROKER_URL,
@@ -10,12 +40,15 @@ celery_app = Celery(
 
 celery_app.conf.update(
     task_track_started=True,
-    task_serializer="json",
-    result_serializer="json",
-    accept_content=["json"],
+    task_serializer="orjson",
+    result_serializer="orjson",
+    accept_content=["orjson", "json"],
     timezone="UTC",
     enable_utc=True,
     broker_connection_retry_on_startup=True,
+    broker_pool_limit=50,
+    broker_transport_options={"socket_keepalive": True},
+    task_publish_retry=False,
     task_queues=celery_settings.CELERY_TASK_QUEUES,
     task_routes=celery_settings.CELERY_TASK_ROUTES,
 )
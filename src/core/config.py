@@ -7,11 +7,31 @@ class Settings(BaseSettings):
 
     Attributes:
         DATABASE_URL (str): The URL for connecting to the database. Defaults to an empty string.
+        DB_POOL_SIZE (int): The number of connections kept open in the database pool. Defaults to 20.
+        DB_MAX_OVERFLOW (int): The number of extra connections allowed above `DB_POOL_SIZE`. Defaults to 40.
+        DB_POOL_RECYCLE (int): The number of seconds after which a pooled connection is replaced. Defaults to 1800.
+        DB_POOL_PRE_PING (bool): Whether to test pooled connections with a ping on checkout. Can be disabled
+            where `DB_POOL_RECYCLE` is enough to avoid stale connections. Defaults to True.
+        DB_STATEMENT_CACHE_SIZE (int): The size of the per-connection prepared statement caches of asyncpg
+            and of the SQLAlchemy asyncpg adapter. Defaults to 500.
         REDIS_URL (str): The URL for connecting to Redis. Defaults to "redis://redis:6379/0".
+        TASK_RESULT_CACHE_TTL (int): The number of seconds a result of an unfinished task is cached. Defaults to 1.
+        TASK_RESULT_FINAL_CACHE_TTL (int): The number of seconds a result of a finished (SUCCESS or FAILURE) task
+            is cached. Defaults to 300.
+        TRANSCRIPTION_CACHE_TTL (int): The number of seconds a GenAI response is cached by audio content.
+            Defaults to 7 days.
+        TASK_STATUS_TTL (int): The number of seconds the transient (STARTED) status of a task is kept in Redis.
+            Defaults to 1 hour.
+        TASK_SOFT_TIME_LIMIT (int): The number of seconds after which a processing task is cancelled and marked
+            as FAILURE. Defaults to 300.
+        TASK_TIME_LIMIT (int): The number of seconds after which the worker process running a task is killed,
+            if the task has not stopped at `TASK_SOFT_TIME_LIMIT`. Defaults to 360.
         MINIO_ENDPOINT (str): The endpoint URL for MinIO storage. Defaults to an empty string.
         MINIO_ROOT_USER (str): The root username for MinIO authentication. Defaults to an empty string.
         MINIO_ROOT_PASSWORD (str): The root password for MinIO authentication. Defaults to an empty string.
         MINIO_BUCKET_NAME (str): The name of the MinIO bucket to use. Defaults to an empty string.
+        MINIO_MAX_POOL_CONNECTIONS (int): The maximum number of pooled connections of the shared S3 client.
+            Defaults to 50.
         GENAI_MODEL_NAME (str): The name of the GenAI model to use. Defaults to an empty string.
         API_KEY (str): The API key for authentication or external services. Defaults to an empty string.
     """
@@ -19,13 +39,25 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
     DATABASE_URL: str = ""
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 500
 
     REDIS_URL: str = "redis://redis:6379/0"
+    TASK_RESULT_CACHE_TTL: int = 1
+    TASK_RESULT_FINAL_CACHE_TTL: int = 300
+    TRANSCRIPTION_CACHE_TTL: int = 7 * 24 * 60 * 60
+    TASK_STATUS_TTL: int = 60 * 60
+    TASK_SOFT_TIME_LIMIT: int = 300
+    TASK_TIME_LIMIT: int = 360
 
     MINIO_ENDPOINT: str = ""
     MINIO_ROOT_USER: str = ""
     MINIO_ROOT_PASSWORD: str = ""
     MINIO_BUCKET_NAME: str = ""
+    MINIO_MAX_POOL_CONNECTIONS: int = 50
 
     GENAI_MODEL_NAME: str = ""
     API_KEY: str = ""
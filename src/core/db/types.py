@@ -4,15 +4,15 @@ from typing import Annotated
 
 from sqlalchemy import Uuid, text
 from sqlalchemy.orm import mapped_column
+from uuid_utils.compat import uuid7
 
 uuidpk = Annotated[
     uuid.UUID,
     mapped_column(
         Uuid,
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         server_default=text("gen_random_uuid()"),
-        index=True,
         nullable=False,
     ),
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import String, Text
+from sqlalchemy import Enum, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.db.types import created_at, updated_at, uuidpk
@@ -15,7 +15,8 @@ class AudioProcessingTask(Base):
 
     Attributes:
         id (Mapped[uuidpk]): The unique identifier (UUID) of the task.
-        status (Mapped[TaskStatusEnum]): The current status of the task. Defaults to `PENDING`.
+        status (Mapped[TaskStatusEnum]): The current status of the task, stored as a native PostgreSQL enum.
+            Defaults to `PENDING`.
         audio_file_key (Mapped[str]): The key identifying the audio file in storage. Cannot be null.
         ai_response (Mapped[str | None]): The AI-generated response for the task, if available. Can be null.
         error_message (Mapped[str | None]): The error message if the task failed. Can be null.
@@ -26,7 +27,12 @@ class AudioProcessingTask(Base):
     __tablename__ = "audio_processing_tasks"
 
     id: Mapped[uuidpk]
-    status: Mapped[TaskStatusEnum] = mapped_column(default=TaskStatusEnum.PENDING, nullable=False)
+    status: Mapped[TaskStatusEnum] = mapped_column(
+        Enum(TaskStatusEnum, name="taskstatusenum", native_enum=True),
+        default=TaskStatusEnum.PENDING,
+        nullable=False,
+        index=True,
+    )
     audio_file_key: Mapped[str] = mapped_column(String, nullable=False)
     ai_response: Mapped[str | None] = mapped_column(Text, nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
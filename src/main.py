@@ -1,7 +1,34 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from redis.asyncio import Redis
 
 from src.api.router import main_router
+from src.core.config import settings
+from src.services.cache import CacheService
+from src.services.minio import MinioService
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Manage resources shared by all requests for the lifetime of the application.
+
+    Opens a single MinioService (and with it one pooled S3 client) on startup, ensuring the bucket exists,
+    and a single Redis client, and closes them on shutdown. The services are stored in `app.state.minio_service`
+    and `app.state.cache_service`.
+
+    Args:
+        app (FastAPI): The application instance.
+    """
+    async with MinioService() as minio_service, Redis.from_url(settings.REDIS_URL, decode_responses=False) as redis:
+        app.state.minio_service = minio_service
+        app.state.cache_service = CacheService(redis)
+        yield
+
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 app.include_router(main_router)
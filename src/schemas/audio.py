@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.core.enums.audio import TaskStatusEnum
 
@@ -15,6 +15,8 @@ class AudioProcessResponseSchema(BaseModel):
         task_id (uuid.UUID): The unique identifier of the created audio processing task.
     """
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     task_id: uuid.UUID = Field(description="The unique ID of the created audio processing task.")
 
 
@@ -31,6 +33,8 @@ class AudioTaskResultResponseSchema(BaseModel):
         error_message (str | None): The error message, if the status is FAILURE.
     """
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     task_id: uuid.UUID = Field(description="The unique ID of the task.")
     status: TaskStatusEnum = Field(description="The current status of the task.")
     created_at: datetime = Field(description="The creation timestamp of the task.")
@@ -0,0 +1,142 @@
+import logging
+import uuid
+from collections.abc import Awaitable, Callable
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+
+class CacheService:
+    """
+    Define a service for caching data in Redis.
+
+    Cache failures are logged and treated as cache misses, so Redis being unavailable
+    never fails a request that could be answered from the database.
+
+    Attributes:
+        redis (Redis): The asynchronous Redis client, created with `decode_responses=False`.
+    """
+
+    def __init__(self, redis: Redis) -> None:
+        self.redis = redis
+
+    @staticmethod
+    def _task_result_key(task_id: uuid.UUID) -> str:
+        """Return the Redis key of the cached result of a task."""
+        return f"task:{task_id}:result"
+
+    @staticmethod
+    def _task_status_key(task_id: uuid.UUID) -> str:
+        """Return the Redis key and pub/sub channel of the transient status of a task."""
+        return f"task:{task_id}:status"
+
+    @staticmethod
+    def _transcription_key(content_key: str) -> str:
+        """Return the Redis key of the cached GenAI response for the given audio content."""
+        return f"transcription:{content_key}"
+
+    async def get_task_result(self, task_id: uuid.UUID) -> bytes | None:
+        """
+        Return the cached serialized result of a task.
+
+        Args:
+            task_id (uuid.UUID): The unique identifier of the task.
+
+        Returns:
+            bytes | None: The cached JSON response body, or None if it is not cached.
+        """
+        try:
+            cached: bytes | None = await self.redis.get(self._task_result_key(task_id))
+        except RedisError as e:
+            logger.warning("Cache: Error reading result of task %s: %s", task_id, e)
+            return None
+        return cached
+
+    async def set_task_result(self, task_id: uuid.UUID, body: bytes, ttl: int) -> None:
+        """
+        Cache the serialized result of a task.
+
+        Args:
+            task_id (uuid.UUID): The unique identifier of the task.
+            body (bytes): The JSON response body to cache.
+            ttl (int): The number of seconds to keep the result cached.
+        """
+        try:
+            await self.redis.set(self._task_result_key(task_id), body, ex=ttl)
+        except RedisError as e:
+            logger.warning("Cache: Error caching result of task %s: %s", task_id, e)
+
+    async def publish_task_status(self, task_id: uuid.UUID, status: str, ttl: int) -> None:
+        """
+        Store the transient status of a task and publish it to the task's status channel.
+
+        Used for status changes that are not written to the database, such as STARTED.
+        Subscribers listen on the `task:{task_id}:status` channel.
+
+        Args:
+            task_id (uuid.UUID): The unique identifier of the task.
+            status (str): The new status of the task.
+            ttl (int): The number of seconds to keep the status stored.
+        """
+        key = self._task_status_key(task_id)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.set(key, status.encode(), ex=ttl)
+                pipe.publish(key, status.encode())
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning("Cache: Error publishing status of task %s: %s", task_id, e)
+
+    async def get_task_status(self, task_id: uuid.UUID) -> str | None:
+        """
+        Return the transient status of a task.
+
+        Args:
+            task_id (uuid.UUID): The unique identifier of the task.
+
+        Returns:
+            str | None: The last published status, or None if none is stored.
+        """
+        try:
+            status: bytes | None = await self.redis.get(self._task_status_key(task_id))
+        except RedisError as e:
+            logger.warning("Cache: Error reading status of task %s: %s", task_id, e)
+            return None
+        return status.decode() if status is not None else None
+
+    async def get_or_set_transcription(
+        self,
+        content_key: str,
+        transcribe: Callable[[], Awaitable[str | None]],
+        ttl: int,
+    ) -> str | None:
+        """
+        Return the cached GenAI response for the given audio content, transcribing it on a cache miss.
+
+        Args:
+            content_key (str): A key identifying the audio content, e.g. the model name and the object's ETag.
+            transcribe (Callable[[], Awaitable[str | None]]): Produces the response on a cache miss.
+            ttl (int): The number of seconds to keep a new response cached.
+
+        Returns:
+            str | None: The cached or newly produced GenAI response.
+        """
+        key = self._transcription_key(content_key)
+        try:
+            cached: bytes | None = await self.redis.get(key)
+        except RedisError as e:
+            logger.warning("Cache: Error reading transcription '%s': %s", content_key, e)
+            cached = None
+        if cached is not None:
+            logger.info("Cache: Transcription '%s' found in cache.", content_key)
+            return cached.decode()
+
+        result = await transcribe()
+        if result is not None:
+            try:
+                await self.redis.set(key, result.encode(), ex=ttl)
+            except RedisError as e:
+                logger.warning("Cache: Error caching transcription '%s': %s", content_key, e)
+        return result
@@ -1,14 +1,19 @@
 import asyncio
+import functools
+import io
 import logging
-import os
 import tempfile
+from collections.abc import AsyncIterator
 
 from google import genai
+from google.genai import types
 
 from src.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
 
 class GenAIService:
     def __init__(self) -> None:
@@ -27,35 +32,64 @@ class GenAIService:
         self.default_prompt = (
             "Listen to the audio. Write a transcription of the text. Then respond to or comment on what was said."
         )
-        logger.info(f"GenAI: Initialized model '{self.model_name}'")
+        logger.info("GenAI: Initialized model '%s'", self.model_name)
 
-    async def transcribe_and_comment_audio(self, audio_data: bytes) -> str | None:
+    async def transcribe_and_comment_audio_stream(
+        self, audio_chunks: AsyncIterator[bytes], mime_type: str = "audio/mpeg"
+    ) -> str | None:
         """
-        Save audio data to a temporary file, upload it to Google Files, send it to the GenerativeModel, and retrieve the response.
+        Upload streamed audio data to Google Files, send it to the GenerativeModel, and retrieve the response.
+
+        The chunks are written to a spooled temporary file as they arrive, which is kept in memory only up to
+        `SPOOL_MAX_SIZE` and then uploaded in chunks, so memory use does not grow with the size of the audio.
 
         Args:
-            audio_data (bytes): The raw audio data to be processed.
+            audio_chunks (AsyncIterator[bytes]): The raw audio data, in chunks.
+            mime_type (str): The MIME type of the audio data. Defaults to "audio/mpeg".
 
         Returns:
             str | None: The response text from the GenerativeModel if successful, or None if an error occurs.
 
         Raises:
-            Exception: If any error occurs during file handling, uploading, or interaction with the Google GenAI API.
+            Exception: If any error occurs during uploading or interaction with the Google GenAI API.
         """
-        logger.info(f"GenAI: Received audio for processing (size: {len(audio_data)} bytes).")
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as audio_file:
+            size = 0
+            async for chunk in audio_chunks:
+                # Past `SPOOL_MAX_SIZE` the file is on disk, so writes run in a thread to keep the event loop free.
+                await asyncio.to_thread(audio_file.write, chunk)
+                size += len(chunk)
+            audio_file.seek(0)
+
+            logger.info("GenAI: Received audio for processing (size: %d bytes, type: %s).", size, mime_type)
+            return await self._transcribe_and_comment_file(audio_file, mime_type)
+
+    async def _transcribe_and_comment_file(self, audio_file: io.IOBase, mime_type: str) -> str | None:
+        """
+        Upload an audio file to Google Files, send it to the GenerativeModel, and retrieve the response.
+
+        The uploaded file is deleted from Google Files afterwards.
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as temp_audio_file:
-            temp_audio_file.write(audio_data)
-            temp_file_path = temp_audio_file.name
+        Args:
+            audio_file (io.IOBase): The audio data, positioned at the start.
+            mime_type (str): The MIME type of the audio data.
+
+        Returns:
+            str | None: The response text from the GenerativeModel if successful, or None if an error occurs.
 
+        Raises:
+            Exception: If any error occurs during uploading or interaction with the Google GenAI API.
+        """
         uploaded_file = None
 
         try:
-            logger.info(f"Starting processing of temporary file: {temp_file_path}")
-
-            uploaded_file = await asyncio.to_thread(self.client.files.upload, file=temp_file_path)
+            uploaded_file = await asyncio.to_thread(
+                self.client.files.upload,
+                file=audio_file,
+                config=types.UploadFileConfig(mime_type=mime_type),
+            )
 
-            logger.info(f"File '{temp_file_path}' uploaded to Google Files as '{uploaded_file.uri}'.")
+            logger.info("Audio uploaded to Google Files as '%s'.", uploaded_file.uri)
 
             response = await asyncio.to_thread(
                 self.client.models.generate_content,
@@ -67,18 +101,26 @@ class GenAIService:
             return response.text
 
         except Exception as e:
-            logger.error(f"Error interacting with Google GenAI: {e}", exc_info=True)
+            logger.error("Error interacting with Google GenAI: %s", e, exc_info=True)
             raise e
         finally:
-            if os.path.exists(temp_file_path):
-                await asyncio.to_thread(os.remove, temp_file_path)
-
             if uploaded_file and uploaded_file.name:
                 try:
                     await asyncio.to_thread(self.client.files.delete, name=uploaded_file.name)
-                    logger.info(f"File '{uploaded_file.name}' deleted from Google Files.")
+                    logger.info("File '%s' deleted from Google Files.", uploaded_file.name)
                 except Exception as delete_e:
-                    logger.error(f"Error deleting file from Google Files: {delete_e}", exc_info=True)
+                    logger.error("Error deleting file from Google Files: %s", delete_e, exc_info=True)
+
+
+@functools.lru_cache(maxsize=1)
+def get_genai_service() -> GenAIService:
+    """
+    Return the GenAIService of the current process, creating it on first use.
 
+    The service keeps its HTTP connection pool for the lifetime of the process. It is only used by
+    the Celery worker, so the API process never creates a GenAI client.
 
-genai_service = GenAIService()
+    Returns:
+        GenAIService: The GenAIService instance of the current process.
+    """
+    return GenAIService()
@@ -1,8 +1,12 @@
+import asyncio
 import logging
-import uuid
-from typing import BinaryIO
+import tempfile
+from collections.abc import AsyncIterator
+from types import TracebackType
+from typing import IO, BinaryIO
 
 import aiobotocore.session
+import zstandard
 from botocore.client import BaseClient
 from botocore.config import Config
 from botocore.exceptions import ClientError
@@ -11,6 +15,30 @@ from src.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Uncompressed audio formats that are worth compressing before they are stored.
+COMPRESSIBLE_EXTENSIONS = frozenset({"wav", "aif", "aiff", "pcm"})
+ZSTD_LEVEL = 3
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+def _zstd_compress(source: BinaryIO) -> IO[bytes]:
+    """
+    Compress a binary stream with zstd into a spooled temporary file.
+
+    The data is compressed in chunks, and the output is kept in memory only up to `SPOOL_MAX_SIZE`.
+
+    Args:
+        source (BinaryIO): The stream to compress, positioned at the start of the data.
+
+    Returns:
+        IO[bytes]: The compressed data, positioned at the start.
+    """
+    compressed = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    zstandard.ZstdCompressor(level=ZSTD_LEVEL).copy_stream(source, compressed)
+    compressed.seek(0)
+    return compressed
+
 
 class MinioService:
     """
@@ -23,12 +51,16 @@ class MinioService:
         session (aiobotocore.session.Session): The session object for creating the S3 client.
         bucket_name (str): The name of the MinIO bucket to interact with.
         _s3_client (BaseClient | None): The S3 client instance, initialized in an async context.
+        _bucket_ready (bool): Whether the bucket has already been checked in this process.
+            Shared by all instances so the check runs only once.
 
     Raises:
         RuntimeError: If the MinioService is used outside of an async context manager.
         ClientError: If there is an issue with MinIO operations, such as missing buckets or file access errors.
     """
 
+    _bucket_ready: bool = False
+
     def __init__(self) -> None:
         self.session = aiobotocore.session.get_session()
         self.bucket_name = settings.MINIO_BUCKET_NAME
@@ -39,7 +71,8 @@ class MinioService:
         Initialize the MinIO S3 client and ensure the bucket exists.
 
         Creates an asynchronous S3 client using the MinIO endpoint and credentials from the application settings.
-        Ensures the specified bucket exists before returning the service instance.
+        Ensures the specified bucket exists before returning the service instance, unless this has already
+        been done in the current process.
 
         Returns:
             MinioService: The initialized MinioService instance.
@@ -49,17 +82,18 @@ class MinioService:
             endpoint_url=f"http://{settings.MINIO_ENDPOINT.split(':')[0]}:9000",
             aws_access_key_id=settings.MINIO_ROOT_USER,
             aws_secret_access_key=settings.MINIO_ROOT_PASSWORD,
-            config=Config(signature_version="s3v4"),
+            config=Config(signature_version="s3v4", max_pool_connections=settings.MINIO_MAX_POOL_CONNECTIONS),
         )
         self._s3_client = await self.client_context.__aenter__()
-        await self._ensure_bucket_exists()
+        if not MinioService._bucket_ready:
+            await self._ensure_bucket_exists()
         return self
 
     async def __aexit__(
         self,
-        exc_type: BaseException | None,
+        exc_type: type[BaseException] | None,
         exc_val: BaseException | None,
-        exc_tb: object | None,
+        exc_tb: TracebackType | None,
     ) -> None:
         """
         Clean up the MinIO S3 client and context.
@@ -89,23 +123,25 @@ class MinioService:
             error_code = int(e.response["Error"]["Code"])
             if error_code == 404:
                 await self._s3_client.create_bucket(Bucket=self.bucket_name)
-                logger.info(f"MinIO: Bucket '{self.bucket_name}' created.")
+                logger.info("MinIO: Bucket '%s' created.", self.bucket_name)
             else:
                 raise
-        logger.info(f"MinIO: Bucket '{self.bucket_name}' is ready.")
+        MinioService._bucket_ready = True
+        logger.info("MinIO: Bucket '%s' is ready.", self.bucket_name)
 
-    async def upload_file(self, file_content: BinaryIO, file_extension: str) -> str:
+    async def upload_file_with_key(self, file_content: BinaryIO, file_key: str) -> None:
         """
-        Upload a file to MinIO and return its key.
+        Upload a file to MinIO under the given key.
 
-        Uses `put_object` to upload the file content as a stream. The file key is generated using a UUID.
+        Uses `put_object` to upload the file content as a stream. The content type is derived from the key's extension.
+        The stream is read in chunks by the HTTP client, so the file is never fully loaded into memory.
+        Uncompressed formats (see `COMPRESSIBLE_EXTENSIONS`) are compressed with zstd and stored with
+        `ContentEncoding="zstd"`; `stream_file` decompresses them transparently.
 
         Args:
-            file_content (BinaryIO): The file content to upload, typically a BytesIO object.
-            file_extension (str): The file extension (e.g., "mp3") to append to the generated key.
-
-        Returns:
-            str: The unique key of the uploaded file in MinIO.
+            file_content (BinaryIO): A seekable binary stream positioned at the start of the file,
+                typically the spooled temporary file backing an `UploadFile`.
+            file_key (str): The key to store the file under, including its extension (e.g., "<uuid>.mp3").
 
         Raises:
             RuntimeError: If the MinioService is used outside of an async context manager.
@@ -114,31 +150,89 @@ class MinioService:
         if not self._s3_client:
             raise RuntimeError("MinioService must be used within an async context manager.")
 
-        file_key = f"{uuid.uuid4()}.{file_extension}"
+        file_extension = file_key.rsplit(".", 1)[-1]
+        body: IO[bytes] = file_content
+        extra_args: dict[str, str] = {}
+        if file_extension.lower() in COMPRESSIBLE_EXTENSIONS:
+            body = await asyncio.to_thread(_zstd_compress, file_content)
+            extra_args["ContentEncoding"] = "zstd"
+
         try:
             await self._s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=file_key,
-                Body=file_content,
+                Body=body,
                 ContentType=f"audio/{file_extension}",
+                **extra_args,
             )
-            logger.info(f"MinIO: File '{file_key}' uploaded.")
-            return file_key
+            logger.info("MinIO: File '%s' uploaded.", file_key)
         except ClientError as e:
-            logger.error(f"MinIO: Error uploading file: {e}")
+            logger.error("MinIO: Error uploading file: %s", e)
             raise
+        finally:
+            if body is not file_content:
+                body.close()
 
-    async def download_file(self, file_key: str) -> bytes:
+    async def delete_file(self, file_key: str) -> None:
         """
-        Download a file from MinIO and return its content as bytes.
+        Delete a file from MinIO.
 
-        Uses `get_object` to retrieve the file and reads its content asynchronously.
+        Args:
+            file_key (str): The key of the file to delete from MinIO.
+
+        Raises:
+            RuntimeError: If the MinioService is used outside of an async context manager.
+            ClientError: If an error occurs during the deletion.
+        """
+        if not self._s3_client:
+            raise RuntimeError("MinioService must be used within an async context manager.")
+
+        try:
+            await self._s3_client.delete_object(Bucket=self.bucket_name, Key=file_key)
+            logger.info("MinIO: File '%s' deleted.", file_key)
+        except ClientError as e:
+            logger.error("MinIO: Error deleting file '%s': %s", file_key, e)
+            raise
+
+    async def get_file_etag(self, file_key: str) -> str:
+        """
+        Return the ETag of a file in MinIO without downloading it.
+
+        The ETag changes with the stored content, so it can be used as a content-based cache key.
 
         Args:
-            file_key (str): The key of the file to download from MinIO.
+            file_key (str): The key of the file in MinIO.
 
         Returns:
-            bytes: The content of the downloaded file.
+            str: The ETag of the file, without surrounding quotes.
+
+        Raises:
+            RuntimeError: If the MinioService is used outside of an async context manager.
+            ClientError: If an error occurs while reading the file metadata.
+        """
+        if not self._s3_client:
+            raise RuntimeError("MinioService must be used within an async context manager.")
+
+        try:
+            response = await self._s3_client.head_object(Bucket=self.bucket_name, Key=file_key)
+            etag: str = response["ETag"].strip('"')
+            return etag
+        except ClientError as e:
+            logger.error("MinIO: Error reading metadata of file '%s': %s", file_key, e)
+            raise
+
+    async def stream_file(self, file_key: str) -> AsyncIterator[bytes]:
+        """
+        Stream a file from MinIO in chunks.
+
+        Uses `get_object` and reads the body in chunks of up to `STREAM_CHUNK_SIZE` bytes, so the file is never
+        fully loaded into memory. Files stored with `ContentEncoding="zstd"` are decompressed chunk by chunk.
+
+        Args:
+            file_key (str): The key of the file to stream from MinIO.
+
+        Yields:
+            bytes: The next chunk of the file content.
 
         Raises:
             RuntimeError: If the MinioService is used outside of an async context manager.
@@ -149,10 +243,14 @@ class MinioService:
 
         try:
             response = await self._s3_client.get_object(Bucket=self.bucket_name, Key=file_key)
-            async with response["Body"] as stream:
-                audio_data = await stream.read()
-            logger.info(f"MinIO: File '{file_key}' downloaded. Size: {len(audio_data)} bytes.")
-            return bytes(audio_data)
         except ClientError as e:
-            logger.error(f"MinIO: Error downloading file '{file_key}': {e}")
+            logger.error("MinIO: Error downloading file '%s': %s", file_key, e)
             raise
+
+        decompressor = zstandard.ZstdDecompressor().decompressobj() if response.get("ContentEncoding") == "zstd" else None
+        async with response["Body"] as stream:
+            async for chunk in stream.iter_chunks(STREAM_CHUNK_SIZE):
+                if decompressor:
+                    chunk = decompressor.decompress(chunk)
+                if chunk:
+                    yield chunk
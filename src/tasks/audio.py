@@ -1,33 +1,198 @@
+import ast
 import asyncio
-import json
+import contextlib
 import logging
+import queue
 import uuid
-from typing import Any
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, cast
 
+import orjson
+import uvloop
+from celery.signals import worker_process_init, worker_process_shutdown
 from google.genai.errors import ClientError as GenAIClientError
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis
+from sqlalchemy import CursorResult, bindparam, update
 
 from src.celery.celery import celery_app
+from src.core.config import settings
 from src.core.enums.audio import TaskStatusEnum
 from src.db.models.audio import AudioProcessingTask
-from src.db.session import async_session
-from src.services.genai import genai_service
+from src.db.session import async_session, engine
+from src.services.cache import CacheService
+from src.services.genai import get_genai_service
 from src.services.minio import MinioService
 
 logger = logging.getLogger(__name__)
 
+_worker_loop: asyncio.AbstractEventLoop | None = None
+_log_listener: QueueListener | None = None
+_minio_service: MinioService | None = None
+_cache_service: CacheService | None = None
+# Exits the context managers of the services above when the worker process shuts down.
+_worker_resources = contextlib.AsyncExitStack()
+
+# Statements built once per process; SQLAlchemy caches their compiled form, and only the bound values change per task.
+# No task objects are loaded in the session, so there is nothing to synchronize after an update.
+_MARK_TASK_SUCCESS = (
+    update(AudioProcessingTask)
+    .where(AudioProcessingTask.id == bindparam("b_task_id"))
+    .values(status=TaskStatusEnum.SUCCESS, ai_response=bindparam("b_ai_response"))
+    .execution_options(synchronize_session=False)
+)
+_MARK_TASK_FAILURE = (
+    update(AudioProcessingTask)
+    .where(AudioProcessingTask.id == bindparam("b_task_id"))
+    .values(
+        status=TaskStatusEnum.FAILURE,
+        error_message=bindparam("b_error_message"),
+        ai_response=bindparam("b_ai_response"),
+    )
+    .execution_options(synchronize_session=False)
+)
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the event loop of the current worker process, creating it on first use.
+
+    The loop is a uvloop loop that lives as long as the process, so tasks do not pay for setting up
+    a new loop and asynchronous clients bound to it can be reused between tasks.
+
+    Returns:
+        asyncio.AbstractEventLoop: The event loop of the current worker process.
+    """
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = uvloop.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+    return _worker_loop
+
+
+async def _open_worker_resources() -> tuple[MinioService, CacheService]:
+    """
+    Return the MinIO and cache services of the current worker process, opening them on first use.
+
+    The services keep their connections open for the lifetime of the process, so tasks reuse warm
+    connections to MinIO and Redis instead of opening new ones.
+
+    Returns:
+        tuple[MinioService, CacheService]: The MinIO and cache services of the current worker process.
+    """
+    global _minio_service, _cache_service
+    if _minio_service is None:
+        _minio_service = await _worker_resources.enter_async_context(MinioService())
+    if _cache_service is None:
+        redis = await _worker_resources.enter_async_context(Redis.from_url(settings.REDIS_URL, decode_responses=False))
+        _cache_service = CacheService(redis)
+    return _minio_service, _cache_service
+
+
+async def _close_worker_resources() -> None:
+    """
+    Close the MinIO and cache services of the current worker process and its database connections.
+    """
+    global _minio_service, _cache_service
+    _minio_service = None
+    _cache_service = None
+    try:
+        await _worker_resources.aclose()
+    finally:
+        await engine.dispose()
+
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    Put log records on the queue unchanged, so the listener's handlers format them.
+
+    The stock `QueueHandler.prepare` formats each record, including its traceback, on the calling thread so
+    that it can be pickled. The records here never leave the process, so that work is left to the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _start_log_listener() -> None:
+    """
+    Move the root logger's handlers behind a queue served by a background thread.
+
+    Log calls on the event loop then only put the record on the queue, and the handlers format and write it
+    to the console or files from the listener thread.
+    """
+    global _log_listener
+    root_logger = logging.getLogger()
+    if _log_listener is not None or not root_logger.handlers:
+        return
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+    root_logger.handlers = [_RecordQueueHandler(log_queue)]
+    _log_listener.start()
+
 
-@celery_app.task(name="process_audio_file")
+def _stop_log_listener() -> None:
+    """
+    Write out the queued log records and give the root logger its handlers back.
+    """
+    global _log_listener
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    logging.getLogger().handlers = list(_log_listener.handlers)
+    _log_listener = None
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs: Any) -> None:
+    """
+    Initialize per-process resources when a Celery worker process starts.
+
+    The event loop, the GenAI client and the MinIO and Redis clients are created here, after the fork,
+    so that each worker process owns its loop and connection pools. Database connections inherited
+    from the parent process are discarded, and logging is moved to a background thread.
+    """
+    _start_log_listener()
+    engine.sync_engine.dispose(close=False)
+    loop = _get_worker_loop()
+    get_genai_service()
+    try:
+        loop.run_until_complete(_open_worker_resources())
+    except Exception as e:
+        # Not fatal: the resources are opened again by the first task.
+        logger.error("[WORKER] Error opening worker resources: %s", e)
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(**kwargs: Any) -> None:
+    """
+    Release per-process resources when a Celery worker process exits.
+    """
+    try:
+        _get_worker_loop().run_until_complete(_close_worker_resources())
+    finally:
+        _stop_log_listener()
+
+
+@celery_app.task(
+    name="process_audio_file",
+    acks_late=True,
+    reject_on_worker_lost=True,
+    time_limit=settings.TASK_TIME_LIMIT,
+)
 def process_audio_file(task_id_str: str, file_key: str) -> dict[str, Any]:
     """
     Execute the background Celery task for processing an audio file.
 
     This task performs the following steps:
-    1. Downloads the audio file from MinIO.
+    1. Downloads the audio file from MinIO, unless a response for the same content is cached in Redis.
     2. Sends it to the GenAI service for transcription and commenting.
     3. Saves the result in PostgreSQL.
 
+    The message is acknowledged only after the task has finished, so it is redelivered if the worker process dies.
+    A task running longer than `TASK_SOFT_TIME_LIMIT` is cancelled and marked as FAILURE; the worker process is killed
+    only if the task is still running at `TASK_TIME_LIMIT`.
+    A redelivered task that has already succeeded returns its saved result instead of being processed again.
+
     Args:
         task_id_str (str): The string representation of the task ID (UUID).
         file_key (str): The key identifying the audio file in MinIO storage.
@@ -45,14 +210,126 @@ def process_audio_file(task_id_str: str, file_key: str) -> dict[str, Any]:
         Exception: For any other unexpected errors during task execution.
     """
     task_id = uuid.UUID(task_id_str)
-    logger.info(f"[WORKER] Received task: task_id={task_id}, file_key={file_key}")
+    logger.info("[WORKER] Received task: task_id=%s, file_key=%s", task_id, file_key)
 
     try:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(_process_audio_file_async(task_id, file_key))
+        loop = _get_worker_loop()
+        return loop.run_until_complete(_process_audio_file_within_time_limit(task_id, file_key))
     except Exception as e:
         error_msg = f"Critical error while running asynchronous logic for task {task_id}: {e}"
-        logger.error(f"[WORKER] {error_msg}")
+        logger.error("[WORKER] %s", error_msg)
+        return {"status": TaskStatusEnum.FAILURE.value, "error": error_msg}
+
+
+def _load_error_details(details_str: str) -> Any:
+    """
+    Parse the error details embedded in a GenAI error message.
+
+    The details are usually the repr of a Python dict, which is parsed with `ast.literal_eval`;
+    anything else is parsed as JSON.
+
+    Args:
+        details_str (str): The part of the error message starting at the details.
+
+    Returns:
+        Any: The parsed details.
+
+    Raises:
+        orjson.JSONDecodeError: If the details are neither a Python dict literal nor valid JSON.
+    """
+    try:
+        details = ast.literal_eval(details_str)
+    except (ValueError, SyntaxError, MemoryError, RecursionError):
+        pass
+    else:
+        if isinstance(details, dict):
+            return details
+    return orjson.loads(details_str)
+
+
+def _parse_genai_error(e: GenAIClientError) -> tuple[Any, str, int | None]:
+    """
+    Extract the details, message and HTTP status code from a GenAI client error.
+
+    The error message may embed a payload with details; it is parsed if present, otherwise
+    the error's `response_json` is used. Runs in a worker thread, as large payloads would block the event loop.
+
+    Args:
+        e (GenAIClientError): The error raised by the GenAI client.
+
+    Returns:
+        tuple[Any, str, int | None]: The error details (or None), the error message, and the HTTP status code (or None).
+    """
+    error_message_str = getattr(e, "message", None) or str(e)
+    error_code_http = getattr(e, "code", None)
+    error_args = getattr(e, "args", ())
+    response_json = getattr(e, "response_json", None)
+
+    error_details_from_exception = None
+    if error_args and isinstance(error_args[0], str):
+        json_part_start = error_message_str.find("{")
+        if json_part_start != -1:
+            try:
+                error_details_from_exception = _load_error_details(error_message_str[json_part_start:])
+            except orjson.JSONDecodeError:
+                pass
+
+    if not error_details_from_exception and response_json:
+        error_details_from_exception = response_json
+
+    return error_details_from_exception, error_message_str, error_code_http
+
+
+async def _record_failure(task_id: uuid.UUID, error_message: str, ai_response: dict[str, Any]) -> None:
+    """
+    Mark a task as FAILURE in the database.
+
+    The status, error message and serialized error details are written with a single UPDATE statement
+    in a new session, without loading the task first. Errors while saving are logged, not raised,
+    so the caller can still report the original failure.
+
+    Args:
+        task_id (uuid.UUID): The unique identifier of the task.
+        error_message (str): The error message to save.
+        ai_response (dict[str, Any]): The error details to save as the task's AI response.
+    """
+    try:
+        params = {
+            "b_task_id": task_id,
+            "b_error_message": error_message,
+            "b_ai_response": orjson.dumps(ai_response, option=orjson.OPT_NON_STR_KEYS).decode(),
+        }
+        async with async_session() as session, session.begin():
+            await session.execute(_MARK_TASK_FAILURE, params)
+    except Exception as e:
+        logger.error("[WORKER] Error updating status after failure of task %s: %s", task_id, e)
+        return
+    logger.info("[WORKER] Task %s status updated to FAILURE.", task_id)
+
+
+async def _process_audio_file_within_time_limit(task_id: uuid.UUID, file_key: str) -> dict[str, Any]:
+    """
+    Process an audio file, marking the task as FAILURE if it runs longer than `TASK_SOFT_TIME_LIMIT`.
+
+    The limit is enforced on the event loop rather than with Celery's `soft_time_limit`: the signal raising
+    `SoftTimeLimitExceeded` is handled inside a uvloop callback while the loop waits on GenAI, so the exception
+    would be dropped instead of stopping the task.
+
+    Args:
+        task_id (uuid.UUID): The unique identifier of the task.
+        file_key (str): The key identifying the audio file in MinIO storage.
+
+    Returns:
+        dict[str, Any]: The result of `_process_audio_file_async`, or the FAILURE status if the time limit is exceeded.
+    """
+    try:
+        async with asyncio.timeout(settings.TASK_SOFT_TIME_LIMIT):
+            return await _process_audio_file_async(task_id, file_key)
+    except TimeoutError:
+        error_msg = f"Task {task_id} exceeded its time limit of {settings.TASK_SOFT_TIME_LIMIT} seconds."
+        logger.error("[WORKER] %s", error_msg)
+
+        await _record_failure(task_id, error_msg, {"general_error": error_msg})
         return {"status": TaskStatusEnum.FAILURE.value, "error": error_msg}
 
 
@@ -76,127 +353,71 @@ async def _process_audio_file_async(task_id: uuid.UUID, file_key: str) -> dict[s
         GenAIClientError: If an error occurs while interacting with the GenAI service.
         Exception: For any other unexpected errors during task execution.
     """
-    session: AsyncSession | None = None
-    minio_service_instance: MinioService | None = None
-
     try:
-        session = async_session()
-
-        minio_service_instance = MinioService()
-        await minio_service_instance.__aenter__()
-
-        # 1. Update the task status to STARTED
-        stmt = select(AudioProcessingTask).where(AudioProcessingTask.id == task_id).with_for_update()
-        result = await session.execute(stmt)
-        task = result.scalar_one_or_none()
+        minio_service, cache_service = await _open_worker_resources()
 
+        # 1. Return the saved result if the task has already been processed, e.g. when its message is redelivered
+        async with async_session() as session:
+            task = await session.get(AudioProcessingTask, task_id)
         if not task:
             raise ValueError(f"Task with ID {task_id} not found in the database.")
-
-        task.status = TaskStatusEnum.STARTED
-        await session.commit()
-        await session.refresh(task)
-        logger.info(f"[WORKER] Task {task_id} status updated to STARTED.")
-
-        # 2. Download the file from MinIO
-        logger.info(f"[WORKER] Downloading {file_key} from MinIO...")
-        audio_data = await minio_service_instance.download_file(file_key)
-        logger.info(f"[WORKER] File {file_key} downloaded. Size: {len(audio_data)} bytes.")
-
-        # 3. Send the audio to the AI service
-        logger.info("[WORKER] Sending audio to AI service...")
-        ai_result_text = await genai_service.transcribe_and_comment_audio(audio_data)
-        logger.info(f"[WORKER] Received result from AI for task {task_id}.")
+        if task.status == TaskStatusEnum.SUCCESS and task.ai_response is not None:
+            logger.info("[WORKER] Task %s has already been processed, returning the saved result.", task_id)
+            return {"status": TaskStatusEnum.SUCCESS.value, "result": task.ai_response}
+
+        # 2. Publish the STARTED status, while reading the file's ETag; only the final status is written to PostgreSQL
+        _, etag = await asyncio.gather(
+            cache_service.publish_task_status(task_id, TaskStatusEnum.STARTED.value, settings.TASK_STATUS_TTL),
+            minio_service.get_file_etag(file_key),
+        )
+        logger.info("[WORKER] Task %s status published as STARTED.", task_id)
+
+        # 3. Transcribe the audio, reusing the cached response if the same content was processed before
+        async def transcribe() -> str | None:
+            logger.info("[WORKER] Streaming %s from MinIO to AI service...", file_key)
+            return await get_genai_service().transcribe_and_comment_audio_stream(minio_service.stream_file(file_key))
+
+        ai_result_text = await cache_service.get_or_set_transcription(
+            f"{settings.GENAI_MODEL_NAME}:{etag}", transcribe, settings.TRANSCRIPTION_CACHE_TTL
+        )
+        logger.info("[WORKER] Received result from AI for task %s.", task_id)
 
         # 4. Save the result in PostgreSQL as SUCCESS
-        task.ai_response = ai_result_text
-        task.status = TaskStatusEnum.SUCCESS
-        await session.commit()
-        await session.refresh(task)
-        logger.info(f"[WORKER] Result for task {task_id} saved in the database. Status SUCCESS.")
+        async with async_session() as session, session.begin():
+            result = cast(
+                CursorResult[Any],
+                await session.execute(_MARK_TASK_SUCCESS, {"b_task_id": task_id, "b_ai_response": ai_result_text}),
+            )
+            if result.rowcount == 0:
+                raise ValueError(f"Task with ID {task_id} not found in the database.")
+        logger.info("[WORKER] Result for task %s saved in the database. Status SUCCESS.", task_id)
 
         # Return SUCCESS status
         return {"status": TaskStatusEnum.SUCCESS.value, "result": ai_result_text}
 
     except GenAIClientError as e:
-        error_code_http = e.code if hasattr(e, "code") else None
-
-        error_details_from_exception = None
-        if hasattr(e, "args") and e.args and isinstance(e.args[0], str):
-            try:
-                message_str = e.message if hasattr(e, "message") else str(e)
-                if message_str:
-                    json_part_start = message_str.find("{")
-                    if json_part_start != -1:
-                        json_str = message_str[json_part_start:]
-                        error_details_from_exception = json.loads(json_str.replace("'", '"'))
-            except (json.JSONDecodeError, IndexError):
-                pass
-
-        if not error_details_from_exception and hasattr(e, "response_json"):
-            error_details_from_exception = e.response_json
-
-        error_message_str = e.message if hasattr(e, "message") else str(e)
+        error_details_from_exception, error_message_str, error_code_http = await asyncio.to_thread(_parse_genai_error, e)
         formatted_error_message = f"GenAI error (HTTP: {error_code_http}): {error_message_str}"
-
-        logger.error(f"[WORKER] GenAI error in task {task_id}: {formatted_error_message}")
-
-        db_task_status = TaskStatusEnum.FAILURE
-        ai_response_to_save = {
-            "error_message": formatted_error_message,
-            "details": error_details_from_exception,
-            "http_status_code": error_code_http,
-        }
-
-        if session:
-            try:
-                await session.rollback()
-                async with async_session() as rollback_session:
-                    stmt = select(AudioProcessingTask).where(AudioProcessingTask.id == task_id).with_for_update()
-                    result = await rollback_session.execute(stmt)
-                    task_to_update = result.scalar_one_or_none()
-                    if task_to_update:
-                        task_to_update.status = db_task_status
-                        task_to_update.error_message = formatted_error_message
-                        task_to_update.ai_response = json.dumps(ai_response_to_save)
-                        await rollback_session.commit()
-                        logger.info(f"[WORKER] Task {task_id} status updated to {db_task_status.value} after GenAI error.")
-            except Exception as rollback_e:
-                logger.error(
-                    f"[WORKER] Error rolling back/updating status after GenAI ClientError for task {task_id}: {rollback_e}"
-                )
-
+        logger.error("[WORKER] GenAI error in task %s: %s", task_id, formatted_error_message)
+
+        await _record_failure(
+            task_id,
+            formatted_error_message,
+            {
+                "error_message": formatted_error_message,
+                "details": error_details_from_exception,
+                "http_status_code": error_code_http,
+            },
+        )
         return {
-            "status": db_task_status.value,
+            "status": TaskStatusEnum.FAILURE.value,
             "error": formatted_error_message,
             "details": error_details_from_exception,
         }
 
     except Exception as e:
         error_msg = f"Unexpected error in task {task_id}: {e}"
-        logger.error(f"[WORKER] {error_msg}")
-        db_task_status = TaskStatusEnum.FAILURE
+        logger.error("[WORKER] %s", error_msg)
 
-        if session:
-            try:
-                await session.rollback()
-                async with async_session() as rollback_session:
-                    stmt = select(AudioProcessingTask).where(AudioProcessingTask.id == task_id).with_for_update()
-                    result = await rollback_session.execute(stmt)
-                    task_to_update = result.scalar_one_or_none()
-                    if task_to_update:
-                        task_to_update.status = db_task_status
-                        task_to_update.error_message = error_msg
-                        task_to_update.ai_response = json.dumps({"general_error": error_msg})
-                        await rollback_session.commit()
-                        logger.info(f"[WORKER] Task {task_id} status updated to {db_task_status.value} after general error.")
-            except Exception as rollback_e:
-                logger.error(f"[WORKER] Error rolling back/updating status after general error for task {task_id}: {rollback_e}")
-
-        return {"status": db_task_status.value, "error": error_msg}
-
-    finally:
-        if session:
-            await session.close()
-        if minio_service_instance:
-            await minio_service_instance.__aexit__(None, None, None)
+        await _record_failure(task_id, error_msg, {"general_error": error_msg})
+        return {"status": TaskStatusEnum.FAILURE.value, "error": error_msg}